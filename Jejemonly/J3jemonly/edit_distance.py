@@ -1,28 +1,120 @@
+from typing import Tuple
+
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    Levenshtein = None
+
+numba_levenshtein = None
+if Levenshtein is None:
+    # Importing compiles the kernel, which is wasted time when RapidFuzz is used
+    try:
+        from .edit_distance_numba import levenshtein as numba_levenshtein
+    except ImportError:
+        pass
+
 class EditDistance:
     @staticmethod
     def calculate(s1: str, s2: str) -> int:
         """Calculate Levenshtein distance between two strings."""
+        if Levenshtein is not None:
+            return Levenshtein.distance(s1, s2)
+        
         if len(s1) < len(s2):
-            return EditDistance.calculate(s2, s1)
+            s1, s2 = s2, s1
         
+        s1, s2 = EditDistance._strip_common_affixes(s1, s2)
         if len(s2) == 0:
             return len(s1)
         
-        previous_row = list(range(len(s2) + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        
-        return previous_row[-1]
+        if numba_levenshtein is not None:
+            return numba_levenshtein(s1, s2, len(s1))
+        return EditDistance._bit_parallel(s1, s2, len(s1))
+    
+    @staticmethod
+    def calculate_bounded(s1: str, s2: str, max_d: int) -> int:
+        """Calculate Levenshtein distance, giving up once it is known to exceed max_d.
+        
+        Returns max_d + 1 when the distance is greater than max_d.
+        """
+        if Levenshtein is not None:
+            return Levenshtein.distance(s1, s2, score_cutoff=max_d)
+        
+        if len(s1) < len(s2):
+            s1, s2 = s2, s1
+        
+        # The distance is at least the difference in length
+        if len(s1) - len(s2) > max_d:
+            return max_d + 1
+        
+        s1, s2 = EditDistance._strip_common_affixes(s1, s2)
+        if len(s2) == 0:
+            return len(s1)
+        
+        if numba_levenshtein is not None:
+            return numba_levenshtein(s1, s2, max_d)
+        return EditDistance._bit_parallel(s1, s2, max_d)
+    
+    @staticmethod
+    def _strip_common_affixes(s1: str, s2: str) -> Tuple[str, str]:
+        """Drop the prefix and suffix shared by both strings, s2 being the shorter one.
+        
+        Shared affixes never contribute to the distance, and jejemon variants
+        usually differ from their stem in only a character or two.
+        """
+        i = 0
+        while i < len(s2) and s1[i] == s2[i]:
+            i += 1
+        j = 0
+        while j < len(s2) - i and s1[-1 - j] == s2[-1 - j]:
+            j += 1
+        if i == 0 and j == 0:
+            return s1, s2
+        return s1[i:len(s1) - j], s2[i:len(s2) - j]
+    
+    @staticmethod
+    def _bit_parallel(s1: str, s2: str, max_d: int) -> int:
+        """Myers/Hyyrö bit-parallel Levenshtein distance, s2 being the shorter string.
+        
+        One int holds the vertical deltas of a whole DP column, so each character
+        of s1 costs a few bitwise ops. Stops early with max_d + 1 once the
+        remaining characters of s1 can no longer bring the score down to max_d.
+        """
+        peq = {}
+        for i, c in enumerate(s2):
+            peq[c] = peq.get(c, 0) | (1 << i)
+        
+        mask = (1 << len(s2)) - 1
+        last = 1 << (len(s2) - 1)
+        vp = mask
+        vn = 0
+        score = len(s2)
+        # Each remaining character lowers the score by at most one
+        bound = max_d + len(s1)
+        for k, c in enumerate(s1):
+            eq = peq.get(c, 0)
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            hp = vn | ~(xh | vp)
+            hn = vp & xh
+            if hp & last:
+                score += 1
+            elif hn & last:
+                score -= 1
+            if score + k >= bound:
+                return max_d + 1
+            hp = (hp << 1) | 1
+            hn = hn << 1
+            vp = (hn | ~(xv | hp)) & mask
+            vn = hp & xv
+        
+        return score
     
     @staticmethod
     def similarity(s1: str, s2: str) -> float:
         """Calculate similarity score between two strings (0-1)."""
+        if Levenshtein is not None:
+            return Levenshtein.normalized_similarity(s1, s2)
         if not s1 and not s2:
             return 1.0
         max_len = max(len(s1), len(s2))
@@ -0,0 +1,45 @@
+import numpy as np
+from numba import njit, types
+
+# np.frombuffer returns read-only arrays
+_CodePoints = types.Array(types.uint32, 1, 'C', readonly=True)
+
+# The explicit signature compiles the kernel at import time rather than on
+# the first call; cache=True keeps the machine code between runs.
+@njit(types.int64(_CodePoints, _CodePoints, types.int64), cache=True)
+def _levenshtein(a, b, max_d):
+    """Two-row Wagner-Fischer DP over code point arrays.
+    
+    Returns max_d + 1 as soon as every cell of a row exceeds max_d.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    
+    previous_row = np.empty(len(b) + 1, np.int64)
+    current_row = np.empty(len(b) + 1, np.int64)
+    for j in range(len(b) + 1):
+        previous_row[j] = j
+    
+    for i in range(len(a)):
+        current_row[0] = i + 1
+        row_min = i + 1
+        for j in range(len(b)):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (a[i] != b[j])
+            current_row[j + 1] = min(insertions, deletions, substitutions)
+            row_min = min(row_min, current_row[j + 1])
+        if row_min > max_d:
+            return max_d + 1
+        previous_row, current_row = current_row, previous_row
+    
+    return min(previous_row[len(b)], max_d + 1)
+
+def _code_points(s: str) -> np.ndarray:
+    # UTF-32 gives one element per character, so non-ASCII text is compared
+    # character by character rather than byte by byte
+    return np.frombuffer(s.encode('utf-32-le'), dtype=np.uint32)
+
+def levenshtein(s1: str, s2: str, max_d: int) -> int:
+    """Calculate Levenshtein distance, or max_d + 1 if it is greater than max_d."""
+    return int(_levenshtein(_code_points(s1), _code_points(s2), max_d))
\ No newline at end of file
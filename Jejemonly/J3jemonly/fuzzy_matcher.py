@@ -1,30 +1,130 @@
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from .edit_distance import EditDistance
 
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    process = None
+    Levenshtein = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def _missing_chars_bound(sig1: int, sig2: int) -> int:
+    """Lower bound on the edit distance of two strings from their character signatures.
+    
+    Each edit removes at most one character and adds at most one, so every
+    character present on only one side needs an edit of its own.
+    """
+    return max(bin(sig1 & ~sig2).count('1'), bin(sig2 & ~sig1).count('1'))
+
 class FuzzyMatcher:
     """Finds similar words."""
     
-    def __init__(self, threshold: float = 0.6):
+    def __init__(self, threshold: float = 0.6, signature_cache_size: int = 10000):
         self.threshold = threshold
         self.edit_distance = EditDistance()
+        self.signature_cache_size = signature_cache_size
+        self._signatures = OrderedDict()
+    
+    def _signature(self, s: str) -> int:
+        """Bitmask of the characters in s (folded to 128 bits), cached per string."""
+        sig = self._signatures.get(s)
+        if sig is None:
+            sig = 0
+            for c in s:
+                sig |= 1 << (ord(c) & 127)
+            self._signatures[s] = sig
+            if len(self._signatures) > self.signature_cache_size:
+                self._signatures.popitem(last=False)
+        return sig
     
     def find_best_match(self, word: str, candidates: List[str]) -> Tuple[str, float]:
         """Find the best matching word from list."""
+        if process is not None:
+            # RapidFuzz's score_cutoff rejects scores equal to the threshold, so check here
+            match = process.extractOne(word, candidates, scorer=Levenshtein.normalized_similarity)
+            if match is None or match[1] < self.threshold:
+                return "", 0.0
+            return match[0], match[1]
+        
         best_match = ""
         best_score = 0.0
+        word_sig = self._signature(word)
         
         for candidate in candidates:
-            score = self.edit_distance.similarity(word, candidate)
-            if score > best_score:
+            max_len = max(len(word), len(candidate))
+            if max_len == 0:
+                score = 1.0
+            else:
+                # Only a candidate scoring at least the threshold and above the
+                # current best can win, which caps the distance worth computing;
+                # the epsilon keeps e.g. (1 - 0.8) * 5 from truncating to 0
+                max_d = int((1.0 - max(best_score, self.threshold)) * max_len + 1e-9)
+                if _missing_chars_bound(word_sig, self._signature(candidate)) > max_d:
+                    continue
+                distance = self.edit_distance.calculate_bounded(word, candidate, max_d)
+                if distance > max_d:
+                    continue
+                score = 1.0 - (distance / max_len)
+            if score >= self.threshold and score > best_score:
                 best_score = score
                 best_match = candidate
         
         return best_match, best_score
     
+    def find_best_match_by_length(self, word: str, candidates_by_len: Dict[int, List[str]],
+                                  rank: Optional[Dict[str, int]] = None) -> Tuple[str, float]:
+        """Find the best matching word, only looking at candidates of a feasible length.
+        
+        A candidate whose length differs too much from the word cannot reach the
+        threshold, so only the buckets around len(word) are searched. When rank
+        is given, ties are resolved in rank order as a full scan would.
+        """
+        if self.threshold <= 0:
+            candidates = [c for bucket in candidates_by_len.values() for c in bucket]
+        else:
+            length = len(word)
+            delta = int(length * (1 - self.threshold) / self.threshold) + 1
+            candidates = []
+            for candidate_len in range(max(length - delta, 0), length + delta + 1):
+                candidates.extend(candidates_by_len.get(candidate_len, ()))
+        if rank is not None:
+            candidates.sort(key=rank.__getitem__)
+        return self.find_best_match(word, candidates)
+    
     def find_matches_above_threshold(self, word: str, candidates: List[str]) -> List[Tuple[str, float]]:
+        if process is not None and np is not None:
+            # Score every candidate in one call; cdist spreads the work over all cores
+            scores = process.cdist([word], candidates, scorer=Levenshtein.normalized_similarity,
+                                   dtype=np.float64, workers=-1)[0]
+            indices = np.flatnonzero(scores >= self.threshold)
+            indices = indices[np.argsort(-scores[indices], kind='stable')]
+            return [(candidates[i], float(scores[i])) for i in indices]
+        
+        if process is not None:
+            # RapidFuzz's score_cutoff rejects scores equal to the threshold, so filter here
+            matches = process.extract(word, candidates, scorer=Levenshtein.normalized_similarity, limit=None)
+            return [(candidate, score) for candidate, score, _ in matches if score >= self.threshold]
+        
         matches = []
+        word_sig = self._signature(word)
         for candidate in candidates:
-            score = self.edit_distance.similarity(word, candidate)
+            max_len = max(len(word), len(candidate))
+            if max_len == 0:
+                score = 1.0
+            else:
+                max_d = int((1.0 - self.threshold) * max_len + 1e-9)
+                if _missing_chars_bound(word_sig, self._signature(candidate)) > max_d:
+                    continue
+                distance = self.edit_distance.calculate_bounded(word, candidate, max_d)
+                if distance > max_d:
+                    continue
+                score = 1.0 - (distance / max_len)
             if score >= self.threshold:
                 matches.append((candidate, score))
         
@@ -1,237 +1,267 @@
-from typing import List, Dict, Tuple
-from .text_preprocessor import TextPreprocessor
-from .tokenizer import Tokenizer
+import json
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Pattern, Tuple
+from .text_preprocessor import DEFAULT as DEFAULT_PREPROCESSOR
+from .tokenizer import DEFAULT as DEFAULT_TOKENIZER
 from .edit_distance import EditDistance
 from .fuzzy_matcher import FuzzyMatcher
 from .lemmatizer import Lemmatizer
 from .lexicon_manager import LexiconManager
 
+logger = logging.getLogger(__name__)
+
+_MEANINGFUL_PUNCTUATION = frozenset({
+    "'", '"', '-', '_', '.', '!', '?', ',', ';', ':', '+',
+    '(', ')', '[', ']', '{', '}', '/', '\\', '|', '@', '#', '$', '%'
+})
+
+# Punctuation stripped from word edges; '+' and '@' are allowed inside words
+_EDGE_PUNCTUATION = re.escape(''.join(sorted(_MEANINGFUL_PUNCTUATION - {'+', '@'})))
+_LEADING_PUNCTUATION = re.compile(rf"^[{_EDGE_PUNCTUATION}]+")
+_TRAILING_PUNCTUATION = re.compile(rf"[{_EDGE_PUNCTUATION}]+$")
+
+# Contractions ("'s" -> "s", "'re" -> "re", ...) only drop the apostrophe, and
+# dropping characters cannot create a new match, so applying them in turn and
+# then removing stray apostrophes and backticks amounts to deleting both
+_APOSTROPHE_TABLE = str.maketrans('', '', "'`")
+
 class JejemonNormalizer:
     def __init__(self, lexicon_file: str = './lexicon/dictionary.json', characters_file: str = './lexicon/characters.json', context_rules_file: str = './lexicon/context_rules.json'):
-        self.preprocessor = TextPreprocessor()
-        self.tokenizer = Tokenizer()
+        self.preprocessor = DEFAULT_PREPROCESSOR
+        self.tokenizer = DEFAULT_TOKENIZER
         self.fuzzy_matcher = FuzzyMatcher(threshold=0.6)
         self.lemmatizer = Lemmatizer()
         self.lexicon_manager = LexiconManager(lexicon_file, characters_file)
         self.context_replacements = self._load_context_rules(context_rules_file)
-        self.meaningful_punctuation = {
-            "'", '"', '-', '_', '.', '!', '?', ',', ';', ':', '+',
-            '(', ')', '[', ']', '{', '}', '/', '\\', '|', '@', '#', '$', '%'
-        }
+        self.meaningful_punctuation = set(_MEANINGFUL_PUNCTUATION)
+
+        # Specific number patterns (years, dates, times, etc.)
+        number_patterns = (
+            r'^\d{4}$',  # Years (1999, 2021, etc.)
+            r'^\d{1,2}[-/]\d{1,2}[-/]\d{2,4}$',  # Dates (12/31/2021, 1-1-21, etc.)
+            r'^\d{1,2}:\d{2}(:\d{2})?([ap]m)?$',  # Times (12:30, 3:45pm, etc.)
+            r'^\d+\.\d+$',  # Decimals (3.14, 12.5, etc.)
+            r'^\d+,\d+$',  # Numbers with commas (1,000, etc.)
+            r'^\d+%$',  # Percentages (50%, etc.)
+            r'^#\d+$',  # Hash numbers (#1, #123, etc.)
+            r'^\$\d+(\.\d{2})?$',  # Money ($10, $15.50, etc.)
+        )
+
+        # Formal codes/IDs (uppercase + numbers, or very long)
+        alphanumeric_patterns = (
+            r'^[A-Z]{2,}\d{2,}$',  # License plates, model numbers (ABC123, ABCD1234, etc.)
+            r'^\d{3,}[A-Z]{2,}$',  # Reverse pattern (123ABC, etc.)
+            r'^[A-Z0-9]{5,}-[A-Z0-9]{3,}$',  # Long codes with dashes
+            r'^[A-Z]{3,}\d{3,}[A-Z]{2,}$',  # Complex mixed patterns
+        )
 
-    def _load_context_rules(self, context_rules_file: str) -> dict:
-        import json
+        # Every pattern is anchored, so one alternation tells whether any of them matches
+        self.skip_pattern = re.compile('|'.join(number_patterns + alphanumeric_patterns), re.IGNORECASE)
+
+        # These only depend on their input and the lexicon, so results are memoized
+        # per instance until the lexicon changes (see clear_cache)
+        self._normalize_word = lru_cache(maxsize=100_000)(self._normalize_word)
+        self._should_apply_character_replacement = lru_cache(maxsize=100_000)(self._should_apply_character_replacement)
+        # Whole texts repeat far less often than words, so keep fewer of them
+        self._normalize_text = lru_cache(maxsize=1024)(self._normalize_text)
+
+    def _load_context_rules(self, context_rules_file: str) -> List[Tuple[str, List[Tuple[Pattern, str]], str]]:
+        """Load context rules as (char, [(pattern, replacement), ...], default) entries, in file order."""
         try:
             with open(context_rules_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                print(f"[DEBUG] Context rules loaded from {context_rules_file}")
-                return data.get('context_aware_rules', {})
+                logger.debug("Context rules loaded from %s", context_rules_file)
+                return [
+                    (char,
+                     [(re.compile(rule['pattern'], re.IGNORECASE), rule['replacement']) for rule in rules['context_rules']],
+                     rules['default'])
+                    for char, rules in data.get('context_aware_rules', {}).items()
+                ]
         except FileNotFoundError:
             print(f"Warning: Context rules file '{context_rules_file}' not found. Using empty rules.")
-            return {}
+            return []
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON in context rules file '{context_rules_file}': {e}")
-            return {}
+            return []
 
-    def _should_apply_character_replacement(self, word: str) -> bool:
+    def _should_apply_character_replacement(self, word: str, word_lower: str) -> bool:
         """
         Skip replacement if:
         - Words that are already normal words
         - Words that are already known jejemon words
         - Pure numbers (but allow mixed alphanumeric that could be jejemon)
         - Specific number patterns (dates, times, etc.)
+
+        word_lower must be word.lower(); callers usually have it at hand already.
         """
-        import re
-        
         # Skip if it's already a normal word
-        if self.lexicon_manager.is_in_words_txt(word):
-            print(f"[DEBUG] Skipping character replacement for '{word}' - already a normal word")
+        if self.lexicon_manager.is_in_words_txt_lower(word_lower):
+            logger.debug("Skipping character replacement for '%s' - already a normal word", word)
             return False
             
         # Skip if it's already a known jejemon word
-        if self.lexicon_manager.get_normal_word(word):
-            print(f"[DEBUG] Skipping character replacement for '{word}' - already a known jejemon word")
+        if self.lexicon_manager.get_normal_word_lower(word_lower):
+            logger.debug("Skipping character replacement for '%s' - already a known jejemon word", word)
             return False
         
         # Skip pure numbers (3+ digits to avoid jejemon like "2", "e2", etc.)
         if word.isdigit() and len(word) >= 3:
-            print(f"[DEBUG] Skipping character replacement for '{word}' - pure number")
+            logger.debug("Skipping character replacement for '%s' - pure number", word)
             return False
             
-        # Skip specific number patterns (years, dates, times, etc.)
-        number_patterns = [
-            r'^\d{4}$',  # Years (1999, 2021, etc.)
-            r'^\d{1,2}[-/]\d{1,2}[-/]\d{2,4}$',  # Dates (12/31/2021, 1-1-21, etc.)
-            r'^\d{1,2}:\d{2}(:\d{2})?([ap]m)?$',  # Times (12:30, 3:45pm, etc.)
-            r'^\d+\.\d+$',  # Decimals (3.14, 12.5, etc.)
-            r'^\d+,\d+$',  # Numbers with commas (1,000, etc.)
-            r'^\d+%$',  # Percentages (50%, etc.)
-            r'^#\d+$',  # Hash numbers (#1, #123, etc.)
-            r'^\$\d+(\.\d{2})?$',  # Money ($10, $15.50, etc.)
-        ]
-        
-        for pattern in number_patterns:
-            if re.match(pattern, word, re.IGNORECASE):
-                print(f"[DEBUG] Skipping character replacement for '{word}' - matches number pattern {pattern}")
-                return False
-        
-        # Skip obvious codes/IDs but allow potential jejemon
-        # Only skip if it looks like a formal code (uppercase + numbers, or very long)
-        alphanumeric_patterns = [
-            r'^[A-Z]{2,}\d{2,}$',  # License plates, model numbers (ABC123, ABCD1234, etc.)
-            r'^\d{3,}[A-Z]{2,}$',  # Reverse pattern (123ABC, etc.)
-            r'^[A-Z0-9]{5,}-[A-Z0-9]{3,}$',  # Long codes with dashes
-            r'^[A-Z]{3,}\d{3,}[A-Z]{2,}$',  # Complex mixed patterns
-        ]
-        
-        for pattern in alphanumeric_patterns:
-            if re.match(pattern, word, re.IGNORECASE):
-                print(f"[DEBUG] Skipping character replacement for '{word}' - matches alphanumeric pattern {pattern}")
-                return False
+        # Skip specific number patterns (years, dates, times, etc.) and obvious codes/IDs,
+        # but allow potential jejemon
+        if self.skip_pattern.match(word):
+            logger.debug("Skipping character replacement for '%s' - matches number or code pattern", word)
+            return False
         
         # Allow character replacement for potential jejemon words
         # This includes short mixed alphanumeric like "22o", "e2", "b4", etc.
-        print(f"[DEBUG] Allowing character replacement for '{word}' - potential jejemon word")
+        logger.debug("Allowing character replacement for '%s' - potential jejemon word", word)
         return True
 
     def _apply_context_aware_replacements(self, word: str) -> str:
-        import re
-        
-        print(f"[DEBUG] Applying context-aware replacements to '{word}'")
+        logger.debug("Applying context-aware replacements to '%s'", word)
         
         # Check if we should apply character replacement
-        if not self._should_apply_character_replacement(word):
-            print(f"[DEBUG] No character replacement needed for '{word}'")
+        if not self._should_apply_character_replacement(word, word.lower()):
+            logger.debug("No character replacement needed for '%s'", word)
             return word
             
         result = word
-        for char, rules in self.context_replacements.items():
+        for char, context_rules, default in self.context_replacements:
             if char in result:
                 applied_context_rule = False
-                for rule in rules['context_rules']:
-                    if re.search(rule['pattern'], result, re.IGNORECASE):
+                for pattern, replacement in context_rules:
+                    if pattern.search(result):
                         old_result = result
-                        result = result.replace(char, rule['replacement'])
-                        print(f"[DEBUG] Context rule applied: '{old_result}' -> '{result}' (char '{char}' -> '{rule['replacement']}')")
+                        result = result.replace(char, replacement)
+                        logger.debug("Context rule applied: '%s' -> '%s' (char '%s' -> '%s')", old_result, result, char, replacement)
                         applied_context_rule = True
                         break
                 if not applied_context_rule:
                     old_result = result
-                    result = result.replace(char, rules['default'])
-                    print(f"[DEBUG] Default replacement applied: '{old_result}' -> '{result}' (char '{char}' -> '{rules['default']}')")
+                    result = result.replace(char, default)
+                    logger.debug("Default replacement applied: '%s' -> '%s' (char '%s' -> '%s')", old_result, result, char, default)
         
         # Apply variant-to-letter and common replacements
         old_result = result
         result = self.lexicon_manager.apply_character_replacements(result)
         if old_result != result:
-            print(f"[DEBUG] Character replacements applied: '{old_result}' -> '{result}'")
+            logger.debug("Character replacements applied: '%s' -> '%s'", old_result, result)
         
         return result
 
     def _evaluate_punctuation_value(self, word: str) -> Tuple[str, bool]:
-        print(f"[DEBUG] Evaluating punctuation for '{word}'")
+        logger.debug("Evaluating punctuation for '%s'", word)
         
         if not any(p in word for p in self.meaningful_punctuation):
-            print(f"[DEBUG] No meaningful punctuation in '{word}'")
+            logger.debug("No meaningful punctuation in '%s'", word)
             return word, False
             
-        meaningful_patterns = [
-            ("'s", "s"), ("'t", "t"), ("'re", "re"), ("'ve", "ve"), ("'ll", "ll"),
-            ("'d", "d"), ("'m", "m"), ("'re", "re"), ("'", ""), ("`", ""), ("'", ""),
-        ]
         original_word = word
-        modified_word = word
-        
-        for punct, replacement in meaningful_patterns:
-            if punct in modified_word:
-                old_modified = modified_word
-                modified_word = modified_word.replace(punct, replacement)
-                print(f"[DEBUG] Punctuation pattern applied: '{old_modified}' -> '{modified_word}' ('{punct}' -> '{replacement}')")
+        modified_word = word.translate(_APOSTROPHE_TABLE)
+        if modified_word != original_word:
+            logger.debug("Punctuation patterns applied: '%s' -> '%s'", original_word, modified_word)
         
         # Try to map using jejemon_to_normal
         original_mapped = self.lexicon_manager.get_normal_word(original_word)
         modified_mapped = self.lexicon_manager.get_normal_word(modified_word)
         
         if original_mapped:
-            print(f"[DEBUG] Original word '{original_word}' maps to '{original_mapped}'")
+            logger.debug("Original word '%s' maps to '%s'", original_word, original_mapped)
         if modified_mapped:
-            print(f"[DEBUG] Modified word '{modified_word}' maps to '{modified_mapped}'")
+            logger.debug("Modified word '%s' maps to '%s'", modified_word, modified_mapped)
         
         if original_mapped and not modified_mapped:
-            print(f"[DEBUG] Using original mapping: '{original_word}' -> '{original_mapped}'")
+            logger.debug("Using original mapping: '%s' -> '%s'", original_word, original_mapped)
             return original_mapped, False
         if modified_mapped and not original_mapped:
-            print(f"[DEBUG] Using modified mapping: '{modified_word}' -> '{modified_mapped}'")
+            logger.debug("Using modified mapping: '%s' -> '%s'", modified_word, modified_mapped)
             return modified_mapped, True
         if original_mapped and modified_mapped:
-            print(f"[DEBUG] Both mapped, using modified: '{modified_word}' -> '{modified_mapped}'")
+            logger.debug("Both mapped, using modified: '%s' -> '%s'", modified_word, modified_mapped)
             return modified_mapped, True
         
-        print(f"[DEBUG] No mapping found, returning original: '{original_word}'")
+        logger.debug("No mapping found, returning original: '%s'", original_word)
         return original_word, False
 
     
     def normalize_word(self, word: str) -> str:
-        print(f"[DEBUG] ===== NORMALIZING WORD: '{word}' =====")
+        return self._normalize_word(word, True)
+
+    def normalize_word_fast(self, word: str) -> str:
+        """Normalize a token whose characters were already replaced (see normalize_text)."""
+        return self._normalize_word(word, False)
+
+    def _normalize_word(self, word: str, replace_characters: bool) -> str:
+        logger.debug("===== NORMALIZING WORD: '%s' =====", word)
+        word_lower = word.lower()
         
-        if self.lexicon_manager.is_in_words_txt(word):
-            print(f"[DEBUG] '{word}' is already in words.txt, returning as-is")
+        if self.lexicon_manager.is_in_words_txt_lower(word_lower):
+            logger.debug("'%s' is already in words.txt, returning as-is", word)
             return word
             
         # First, check direct mapping
-        normal_word = self.lexicon_manager.get_normal_word(word)
+        normal_word = self.lexicon_manager.get_normal_word_lower(word_lower)
         if normal_word:
-            print(f"[DEBUG] Direct mapping found: '{word}' -> '{normal_word}'")
+            logger.debug("Direct mapping found: '%s' -> '%s'", word, normal_word)
             return normal_word
         
         # Apply character replacements only if appropriate
-        if self._should_apply_character_replacement(word):
+        if replace_characters and self._should_apply_character_replacement(word, word_lower):
             modified_word = self.lexicon_manager.apply_character_replacements(word)
             if modified_word != word:
-                print(f"[DEBUG] Character replacements applied: '{word}' -> '{modified_word}'")
+                logger.debug("Character replacements applied: '%s' -> '%s'", word, modified_word)
                 normal_word = self.lexicon_manager.get_normal_word(modified_word)
                 if normal_word:
-                    print(f"[DEBUG] Modified word maps to: '{modified_word}' -> '{normal_word}'")
+                    logger.debug("Modified word maps to: '%s' -> '%s'", modified_word, normal_word)
                     return normal_word
         
         # Try fuzzy matching
-        jejemon_words = self.lexicon_manager.get_all_jejemon_words()
-        if jejemon_words:
-            print(f"[DEBUG] Attempting fuzzy matching for '{word}'")
-            best_match, score = self.fuzzy_matcher.find_best_match(word, jejemon_words)
-            print(f"[DEBUG] Best fuzzy match: '{best_match}' with score {score}")
+        jejemon_by_len = self.lexicon_manager.jejemon_by_len
+        if jejemon_by_len:
+            logger.debug("Attempting fuzzy matching for '%s'", word)
+            best_match, score = self.fuzzy_matcher.find_best_match_by_length(word, jejemon_by_len, self.lexicon_manager.jejemon_rank)
+            logger.debug("Best fuzzy match: '%s' with score %s", best_match, score)
             
             if score > 0.6:
                 matched_normal = self.lexicon_manager.get_normal_word(best_match)
                 if matched_normal:
-                    print(f"[DEBUG] Fuzzy match success: '{word}' -> '{best_match}' -> '{matched_normal}'")
+                    logger.debug("Fuzzy match success: '%s' -> '%s' -> '%s'", word, best_match, matched_normal)
                     return matched_normal
         
         # Try lemmatization then fuzzy matching
         lemmatized = self.lemmatizer.lemmatize(word)
         if lemmatized != word:
-            print(f"[DEBUG] Lemmatized: '{word}' -> '{lemmatized}'")
+            logger.debug("Lemmatized: '%s' -> '%s'", word, lemmatized)
             normal_word = self.lexicon_manager.get_normal_word(lemmatized)
             if normal_word:
-                print(f"[DEBUG] Lemmatized word maps to: '{lemmatized}' -> '{normal_word}'")
+                logger.debug("Lemmatized word maps to: '%s' -> '%s'", lemmatized, normal_word)
                 return normal_word
             
-            if jejemon_words:
-                print(f"[DEBUG] Attempting fuzzy matching for lemmatized word '{lemmatized}'")
-                best_match, score = self.fuzzy_matcher.find_best_match(lemmatized, jejemon_words)
-                print(f"[DEBUG] Best fuzzy match for lemmatized: '{best_match}' with score {score}")
+            if jejemon_by_len:
+                logger.debug("Attempting fuzzy matching for lemmatized word '%s'", lemmatized)
+                best_match, score = self.fuzzy_matcher.find_best_match_by_length(lemmatized, jejemon_by_len, self.lexicon_manager.jejemon_rank)
+                logger.debug("Best fuzzy match for lemmatized: '%s' with score %s", best_match, score)
                 if score > 0.6:
                     matched_normal = self.lexicon_manager.get_normal_word(best_match)
                     if matched_normal:
-                        print(f"[DEBUG] Lemmatized fuzzy match success: '{lemmatized}' -> '{best_match}' -> '{matched_normal}'")
+                        logger.debug("Lemmatized fuzzy match success: '%s' -> '%s' -> '%s'", lemmatized, best_match, matched_normal)
                         return matched_normal
         
         # If no match found, return original word
-        print(f"[DEBUG] No normalization found for '{word}', returning original")
+        logger.debug("No normalization found for '%s', returning original", word)
         return word
 
     def normalize_text(self, text: str) -> Dict[str, str]:
-        print(f"[DEBUG] ===== NORMALIZING TEXT: '{text}' =====")
+        # Hand out a copy so callers cannot change the memoized result
+        return dict(self._normalize_text(text))
+
+    def _normalize_text(self, text: str) -> Dict[str, str]:
+        logger.debug("===== NORMALIZING TEXT: '%s' =====", text)
         
         result = {
             'original': text,
@@ -242,172 +272,140 @@ class JejemonNormalizer:
         }
         
         # Step 1: Apply punctuation evaluation to the entire text
-        print(f"[DEBUG] Step 1: Punctuation evaluation")
+        logger.debug("Step 1: Punctuation evaluation")
         punctuation_evaluated_text = self._apply_punctuation_evaluation_to_text(text)
         result['punctuation_evaluated'] = punctuation_evaluated_text
-        print(f"[DEBUG] After punctuation evaluation: '{punctuation_evaluated_text}'")
+        logger.debug("After punctuation evaluation: '%s'", punctuation_evaluated_text)
         
         # Step 2: Apply character replacements to the entire text
-        print(f"[DEBUG] Step 2: Character replacements")
+        logger.debug("Step 2: Character replacements")
         character_replaced_text = self._apply_character_replacements_to_text(punctuation_evaluated_text)
         result['character_replaced'] = character_replaced_text
-        print(f"[DEBUG] After character replacements: '{character_replaced_text}'")
+        logger.debug("After character replacements: '%s'", character_replaced_text)
         
         # Step 3: Tokenize the character-replaced text
-        print(f"[DEBUG] Step 3: Tokenization")
+        logger.debug("Step 3: Tokenization")
         tokens = self.tokenizer.tokenize(character_replaced_text)
         result['tokenized'] = ' '.join(tokens)
-        print(f"[DEBUG] Tokens: {tokens}")
-        
-        # Step 4: Apply word-level normalization to each token
-        print(f"[DEBUG] Step 4: Word-level normalization")
+        logger.debug("Tokens: %s", tokens)
+        
+        # Step 4: Apply word-level normalization to each token. A token that is
+        # a whole step 2 word already went through character replacement; one
+        # split off inside a word ("ck" from "tr,ck") was only replaced as part
+        # of that word, so it still needs the full normalize_word
+        logger.debug("Step 4: Word-level normalization")
+        replaced_words = set(character_replaced_text.lower().split())
         normalized_tokens = []
         for i, token in enumerate(tokens):
-            print(f"[DEBUG] Processing token {i+1}/{len(tokens)}: '{token}'")
-            normalized_token = self.normalize_word(token)
+            logger.debug("Processing token %s/%s: '%s'", i+1, len(tokens), token)
+            if token in replaced_words:
+                normalized_token = self.normalize_word_fast(token)
+            else:
+                normalized_token = self.normalize_word(token)
             normalized_tokens.append(normalized_token)
-            print(f"[DEBUG] Token normalized: '{token}' -> '{normalized_token}'")
+            logger.debug("Token normalized: '%s' -> '%s'", token, normalized_token)
         
         # Step 5: Detokenize the normalized tokens
-        print(f"[DEBUG] Step 5: Detokenization")
+        logger.debug("Step 5: Detokenization")
         result['normalized'] = self.tokenizer.detokenize(normalized_tokens)
-        print(f"[DEBUG] Final result: '{result['normalized']}'")
+        logger.debug("Final result: '%s'", result['normalized'])
         
         return result
 
+    def normalize_batch(self, texts: Iterable[str]) -> Iterator[Dict[str, str]]:
+        """Normalize texts one by one as they are read; repeated texts are served from the cache."""
+        for text in texts:
+            yield dict(self._normalize_text(text))
+
     def _apply_punctuation_evaluation_to_text(self, text: str) -> str:
         """Apply punctuation evaluation patterns to entire text before tokenization"""
-        import re
 
-        print(f"[DEBUG] Applying punctuation evaluation to text: '{text}'")
-        
-        meaningful_patterns = [
-            ("'s", "s"), ("'t", "t"), ("'re", "re"), ("'ve", "ve"),
-            ("'ll", "ll"), ("'d", "d"), ("'m", "m"), ("'", ""), ("`", "")
-        ]
+        logger.debug("Applying punctuation evaluation to text: '%s'", text)
         
         original_text = text
-        for punct, replacement in meaningful_patterns:
-            if punct in text:
-                old_text = text
-                text = text.replace(punct, replacement)
-                print(f"[DEBUG] Text punctuation replacement: '{punct}' -> '{replacement}' in '{old_text}' -> '{text}'")
+        text = text.translate(_APOSTROPHE_TABLE)
+        if text != original_text:
+            logger.debug("Text punctuation replacement: '%s' -> '%s'", original_text, text)
 
         cleaned_words = []
         for word in text.split():
             original = word
-            print(f"[DEBUG] Processing word for punctuation cleanup: '{word}'")
+            logger.debug("Processing word for punctuation cleanup: '%s'", word)
 
             if self.lexicon_manager.get_normal_word(word):
-                print(f"[DEBUG] Word '{word}' has jejemon mapping, keeping as-is")
+                logger.debug("Word '%s' has jejemon mapping, keeping as-is", word)
                 cleaned_words.append(word)
                 continue
 
-            allowed_inside = {'+', '@'}
-            allowed_str = ''.join(allowed_inside)
-
-            cleaned = re.sub(rf"^[{re.escape(''.join(self.meaningful_punctuation - allowed_inside))}]+", "", word)
-            cleaned = re.sub(rf"[{re.escape(''.join(self.meaningful_punctuation - allowed_inside))}]+$", "", cleaned)
+            cleaned = _TRAILING_PUNCTUATION.sub("", _LEADING_PUNCTUATION.sub("", word))
             
             if cleaned != original:
-                print(f"[DEBUG] Punctuation cleaned: '{original}' -> '{cleaned}'")
+                logger.debug("Punctuation cleaned: '%s' -> '%s'", original, cleaned)
 
             cleaned_words.append(cleaned)
 
         result = ' '.join(cleaned_words)
         if result != original_text:
-            print(f"[DEBUG] Final punctuation evaluation result: '{original_text}' -> '{result}'")
+            logger.debug("Final punctuation evaluation result: '%s' -> '%s'", original_text, result)
         return result
 
     def _apply_character_replacements_to_text(self, text: str) -> str:
         """Apply context-aware character replacements to entire text"""
-        import re
-        
-        print(f"[DEBUG] Applying character replacements to text: '{text}'")
+        logger.debug("Applying character replacements to text: '%s'", text)
         
         # Process word by word 
-        words = text.split()
-        processed_words = []
-        
-        for i, word in enumerate(words):
-            print(f"[DEBUG] Processing word {i+1}/{len(words)} for character replacement: '{word}'")
-            
-            # Check if we should apply character replacement to this word
-            if not self._should_apply_character_replacement(word):
-                processed_words.append(word)
-                continue
-                
-            result = word
-            
-            # Apply context-aware replacements to each word individually
-            for char, rules in self.context_replacements.items():
-                if char in result:
-                    applied_context_rule = False
-                    for rule in rules['context_rules']:
-                        # Pattern now applies to individual word, not full text
-                        if re.search(rule['pattern'], result, re.IGNORECASE):
-                            old_result = result
-                            result = result.replace(char, rule['replacement'])
-                            print(f"[DEBUG] Context rule applied to '{word}': '{old_result}' -> '{result}' ('{char}' -> '{rule['replacement']}')")
-                            applied_context_rule = True
-                            break
-                    if not applied_context_rule:
-                        old_result = result
-                        result = result.replace(char, rules['default'])
-                        print(f"[DEBUG] Default replacement applied to '{word}': '{old_result}' -> '{result}' ('{char}' -> '{rules['default']}')")
-            
-            # Apply variant-to-letter and common replacements
-            old_result = result
-            result = self.lexicon_manager.apply_character_replacements(result)
-            if old_result != result:
-                print(f"[DEBUG] Lexicon character replacements applied to '{word}': '{old_result}' -> '{result}'")
-            
-            processed_words.append(result)
-        
-        final_result = ' '.join(processed_words)
+        final_result = ' '.join(self._apply_context_aware_replacements(word) for word in text.split())
         if final_result != text:
-            print(f"[DEBUG] Final character replacement result: '{text}' -> '{final_result}'")
+            logger.debug("Final character replacement result: '%s' -> '%s'", text, final_result)
         return final_result
 
     def add_variant(self, letter: str, variant: str):
-        print(f"[DEBUG] Adding variant: '{letter}' -> '{variant}'")
+        logger.debug("Adding variant: '%s' -> '%s'", letter, variant)
         self.lexicon_manager.add_variant(letter, variant)
         self.lexicon_manager.save_characters()
+        self.clear_cache()
 
     # def add_word_mapping(self, jejemon: str, normal: str):
     #     self.lexicon_manager.add_mapping(jejemon, normal)
     #     self.lexicon_manager.save_lexicon()
+    #     self.clear_cache()
+
+    def clear_cache(self):
+        """Forget memoized results; call after changing the lexicon directly."""
+        self._normalize_word.cache_clear()
+        self._should_apply_character_replacement.cache_clear()
+        self._normalize_text.cache_clear()
 
     def get_normalization_confidence(self, original: str, normalized: str) -> float:
-        print(f"[DEBUG] Calculating confidence for: '{original}' -> '{normalized}'")
+        logger.debug("Calculating confidence for: '%s' -> '%s'", original, normalized)
         
         if original == normalized:
-            print(f"[DEBUG] No changes made, confidence: 0.0")
+            logger.debug("No changes made, confidence: 0.0")
             return 0.0
             
         original_tokens = self.tokenizer.tokenize(original)
         normalized_tokens = self.tokenizer.tokenize(normalized)
-        print(f"[DEBUG] Original tokens: {original_tokens}")
-        print(f"[DEBUG] Normalized tokens: {normalized_tokens}")
+        logger.debug("Original tokens: %s", original_tokens)
+        logger.debug("Normalized tokens: %s", normalized_tokens)
         
         if len(original_tokens) != len(normalized_tokens):
-            print(f"[DEBUG] Token count mismatch, confidence: 0.5")
+            logger.debug("Token count mismatch, confidence: 0.5")
             return 0.5
             
         if not original_tokens:
-            print(f"[DEBUG] No tokens, confidence: 0.0")
+            logger.debug("No tokens, confidence: 0.0")
             return 0.0
             
         total_confidence = 0.0
         for i, (orig_word, norm_word) in enumerate(zip(original_tokens, normalized_tokens)):
             if orig_word == norm_word:
-                print(f"[DEBUG] Token {i+1} unchanged: '{orig_word}' -> confidence: 1.0")
+                logger.debug("Token %s unchanged: '%s' -> confidence: 1.0", i+1, orig_word)
                 total_confidence += 1.0
             else:
                 similarity = EditDistance.similarity(orig_word, norm_word)
-                print(f"[DEBUG] Token {i+1} changed: '{orig_word}' -> '{norm_word}' -> confidence: {similarity}")
+                logger.debug("Token %s changed: '%s' -> '%s' -> confidence: %s", i+1, orig_word, norm_word, similarity)
                 total_confidence += similarity
         
         final_confidence = total_confidence / len(original_tokens)
-        print(f"[DEBUG] Final confidence: {final_confidence}")
+        logger.debug("Final confidence: %s", final_confidence)
         return final_confidence
\ No newline at end of file
@@ -1,18 +1,41 @@
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+def _build_trie(affixes: Iterable[str]) -> Dict:
+    """Build a nested-dict trie; '' marks the end of an affix."""
+    trie = {}
+    for affix in affixes:
+        node = trie
+        for char in affix:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return trie
+
+def _longest_match(trie: Dict, chars: Iterable[str], max_len: int) -> int:
+    """Length of the longest affix in trie that chars start with, at most max_len."""
+    longest = 0
+    node = trie
+    for depth, char in enumerate(chars, 1):
+        if depth > max_len:
+            break
+        node = node.get(char)
+        if node is None:
+            break
+        if '' in node:
+            longest = depth
+    return longest
 
 class Lemmatizer:
     def __init__(self):
         self.prefix_rules = {
             'nag': ['nag', 'mag'],
-            'naka': ['naka', 'maka'],
-            'nai': ['nai', 'mai'],
+            'naka': ['naka', 'maka', 'ka'],
+            'nai': ['nai', 'mai', 'i'],
             'napa': ['napa', 'mapa'],
             'naging': ['naging', 'maging'],
             'naki': ['naki', 'maki'],
             'nang': ['nang', 'mang'],
-            'naka': ['naka', 'ka'],
-            'nai': ['nai', 'i'],
             'na': ['na', 'ma']
         }
         
@@ -26,22 +49,26 @@ class Lemmatizer:
             'on': '',
             'un': ''
         }
+        
+        # Suffixes are matched from the end of the word, so store them reversed
+        self._prefix_trie = _build_trie(self.prefix_rules)
+        self._suffix_trie = _build_trie(suffix[::-1] for suffix in self.suffix_rules)
+        
+        # The rules never change, so results can be memoized per instance
+        self.lemmatize = lru_cache(maxsize=100_000)(self.lemmatize)
     
     def lemmatize(self, word: str) -> str:
         """lemmatization by removing common affixes."""
         original_word = word
         
-        # Handle prefixes
-        for prefix, alternatives in self.prefix_rules.items():
-            if word.startswith(prefix):
-                word = word[len(prefix):]
-                break
+        # Handle prefixes (longest match)
+        prefix_len = _longest_match(self._prefix_trie, word, len(word))
+        word = word[prefix_len:]
         
-        # Handle suffixes
-        for suffix in self.suffix_rules:
-            if word.endswith(suffix) and len(word) > len(suffix):
-                word = word[:-len(suffix)]
-                break
+        # Handle suffixes (longest match that leaves something behind)
+        suffix_len = _longest_match(self._suffix_trie, reversed(word), len(word) - 1)
+        if suffix_len:
+            word = word[:-suffix_len]
         
         if len(word) < 2:
             return original_word
@@ -1,6 +1,52 @@
 import json
 import re
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+# Characters re.IGNORECASE treats as equal that str.lower/upper/title do not
+# connect (e.g. the Kelvin sign and 'k', long s and 's'), per Unicode 15
+_CASE_CLASSES = (
+    'Ii\u0130\u0131', 'Kk\u212a', 'Ss\u017f', '\xb5\u039c\u03bc',
+    '\xc5\xe5\u212b', '\xdf\u1e9e', '\u0345\u0399\u03b9\u1fbe', '\u0390\u1fd3',
+    '\u0392\u03b2\u03d0', '\u0395\u03b5\u03f5', '\u0398\u03b8\u03d1\u03f4',
+    '\u039a\u03ba\u03f0', '\u03a0\u03c0\u03d6', '\u03a1\u03c1\u03f1',
+    '\u03a3\u03c2\u03c3', '\u03a6\u03c6\u03d5', '\u03a9\u03c9\u2126',
+    '\u03b0\u1fe3', '\u0412\u0432\u1c80', '\u0414\u0434\u1c81',
+    '\u041e\u043e\u1c82', '\u0421\u0441\u1c83', '\u0422\u0442\u1c84\u1c85',
+    '\u042a\u044a\u1c86', '\u0462\u0463\u1c87', '\u1c88\ua64a\ua64b',
+    '\u1e60\u1e61\u1e9b', '\ufb05\ufb06',
+)
+_CASE_CLASS_OF = {char: case_class for case_class in _CASE_CLASSES for char in case_class}
+
+def _case_variants(char: str) -> set:
+    """Every character a case-insensitive pattern for char matches."""
+    variants = set()
+    pending = [char]
+    while pending:
+        current = pending.pop()
+        if current in variants:
+            continue
+        variants.add(current)
+        pending.extend(_CASE_CLASS_OF.get(current, ''))
+        for mapped in (current.lower(), current.upper(), current.title()):
+            if len(mapped) == 1:
+                pending.append(mapped)
+    return variants
+
+def _translation_table(rules: List[Tuple[str, str]]) -> Dict[int, str]:
+    """Build a str.translate table equivalent to applying each single-character,
+    case-insensitive re.sub in rules one after another."""
+    chars = set()
+    for old, _ in rules:
+        chars |= _case_variants(old)
+    table = {}
+    for char in chars:
+        replaced = char
+        for old, new in rules:
+            replaced = re.sub(re.escape(old), new, replaced, flags=re.IGNORECASE)
+        if replaced != char:
+            table[ord(char)] = replaced
+    return table
 
 class LexiconManager:
     def __init__(self, lexicon_file: str = './lexicon/dictionary.json', characters_file: str = './lexicon/characters.json', words_file: str = './lexicon/words.txt'):
@@ -11,8 +57,13 @@ class LexiconManager:
         self.characters = self.load_characters()
         self.letter_variants = self.characters.get('letter_variants', {})
         self.jejemon_to_normal = self.lexicon.get('jejemon_to_normal', {})
+        self._jejemon_keys_cache = tuple(self.jejemon_to_normal.keys())
+        self.jejemon_by_len = self._create_jejemon_by_len()
+        self.jejemon_rank = {jejemon: i for i, jejemon in enumerate(self.jejemon_to_normal)}
         self.common_replacements = self.lexicon.get('common_replacements', {})
         self.variant_to_letter = self._create_variant_to_letter()
+        self._create_variant_steps()
+        self._create_common_steps()
         self.words_set = self.load_words_txt()
 
     def load_lexicon(self) -> Dict:
@@ -52,6 +103,10 @@ class LexiconManager:
     def is_in_words_txt(self, word: str) -> bool:
         return word.lower() in self.words_set
 
+    def is_in_words_txt_lower(self, word: str) -> bool:
+        """Same as is_in_words_txt for a word that is already lowercase."""
+        return word in self.words_set
+
     def _create_variant_to_letter(self) -> Dict[str, str]:
         variant_map = {}
         for letter, variants in self.letter_variants.items():
@@ -59,6 +114,45 @@ class LexiconManager:
                 variant_map[variant.lower()] = letter.lower()
         return variant_map
 
+    def _create_variant_steps(self):
+        """Precompute what apply_character_replacements does for the current variants."""
+        # Multi-character variants only replace a whole word; the longest one wins
+        self._word_variants = {}
+        single_char_variants = []
+        for variant in sorted(self.variant_to_letter.keys(), key=len, reverse=True):
+            base = self.variant_to_letter[variant]
+            if variant == base:
+                continue
+            if len(variant) == 1:
+                single_char_variants.append((variant, base))
+            else:
+                self._word_variants.setdefault(variant, base)
+        self._variant_table = _translation_table(single_char_variants)
+
+    def _create_common_steps(self):
+        """Precompute what apply_character_replacements does for the common replacements."""
+        # Common replacements must run in order, since one can create or destroy a
+        # match for the next ('que' -> 'kue' -> 'ko'). Consecutive single-character
+        # rules are merged into one translate table.
+        self._common_steps = []
+        single_char_rules = []
+        for old, new in self.common_replacements.items():
+            if len(old) == 1:
+                single_char_rules.append((old, new))
+                continue
+            if single_char_rules:
+                self._common_steps.append(_translation_table(single_char_rules))
+                single_char_rules = []
+            self._common_steps.append((re.compile(re.escape(old), re.IGNORECASE), new))
+        if single_char_rules:
+            self._common_steps.append(_translation_table(single_char_rules))
+
+    def _create_jejemon_by_len(self) -> Dict[int, List[str]]:
+        by_len = defaultdict(list)
+        for jejemon in self.jejemon_to_normal:
+            by_len[len(jejemon)].append(jejemon)
+        return by_len
+
     def get_base_letter(self, variant: str) -> Optional[str]:
         return self.variant_to_letter.get(variant.lower())
 
@@ -79,6 +173,9 @@ class LexiconManager:
         if variant not in self.letter_variants[letter]:
             self.letter_variants[letter].append(variant)
             self.variant_to_letter[variant] = letter
+            # Rebuilt on the next apply_character_replacements, so adding
+            # several variants in a row only pays for it once
+            self._variant_table = None
         self.characters['letter_variants'] = self.letter_variants
 
     def save_lexicon(self):
@@ -101,32 +198,40 @@ class LexiconManager:
         self.save_characters()
 
     def apply_character_replacements(self, word: str) -> str:
-        result = word
-        for variant in sorted(self.variant_to_letter.keys(), key=len, reverse=True):
-            base = self.variant_to_letter[variant]
-            if variant == base:
-                continue
-            if len(variant) == 1:
-                pattern = re.escape(variant)
-                result = re.sub(pattern, base, result, flags=re.IGNORECASE)
+        if self._variant_table is None:
+            self._create_variant_steps()
+        result = self._word_variants.get(word.lower(), word)
+        result = result.translate(self._variant_table)
+        for step in self._common_steps:
+            if isinstance(step, dict):
+                result = result.translate(step)
             else:
-                # Only replace multi-character variant if it matches the whole word
-                if result.lower() == variant:
-                    result = base
-        for old, new in self.common_replacements.items():
-            pattern = re.escape(old)
-            result = re.sub(pattern, new, result, flags=re.IGNORECASE)
+                pattern, new = step
+                result = pattern.sub(new, result)
         return result
 
     def get_normal_word(self, jejemon_word: str) -> Optional[str]:
         return self.jejemon_to_normal.get(jejemon_word.lower())
 
-    def get_all_jejemon_words(self) -> List[str]:
-        return list(self.jejemon_to_normal.keys())
+    def get_normal_word_lower(self, jejemon_word: str) -> Optional[str]:
+        """Same as get_normal_word for a word that is already lowercase."""
+        return self.jejemon_to_normal.get(jejemon_word)
+
+    def get_all_jejemon_words(self) -> Tuple[str, ...]:
+        # Called for every word being normalized, so the keys are only
+        # collected again after add_mapping changes them
+        if self._jejemon_keys_cache is None:
+            self._jejemon_keys_cache = tuple(self.jejemon_to_normal.keys())
+        return self._jejemon_keys_cache
 
     def get_all_normal_words(self) -> List[str]:
         return list(self.jejemon_to_normal.values())
 
     def add_mapping(self, jejemon: str, normal: str):
-        self.jejemon_to_normal[jejemon.lower()] = normal.lower()
+        jejemon = jejemon.lower()
+        if jejemon not in self.jejemon_to_normal:
+            self.jejemon_by_len[len(jejemon)].append(jejemon)
+            self.jejemon_rank[jejemon] = len(self.jejemon_rank)
+            self._jejemon_keys_cache = None
+        self.jejemon_to_normal[jejemon] = normal.lower()
         self.lexicon['jejemon_to_normal'] = self.jejemon_to_normal
\ No newline at end of file
@@ -1,27 +1,49 @@
-import re
+from typing import Callable
+
+class _DeletionTable(dict):
+    """str.translate table deleting every character that keep() rejects.
+    
+    Entries are filled in on first lookup, so the table only ever holds the
+    characters actually seen instead of all of Unicode.
+    """
+    
+    def __init__(self, keep: Callable[[str], bool]):
+        super().__init__()
+        self.keep = keep
+    
+    def __missing__(self, code_point: int):
+        value = code_point if self.keep(chr(code_point)) else None
+        self[code_point] = value
+        return value
+
+# Same character classes as the regexes [^\w\s] and [^a-zA-Z0-9\s]
+_PUNCTUATION_TABLE = _DeletionTable(lambda c: c.isalnum() or c == '_' or c.isspace())
+_SPECIAL_CHARS_TABLE = _DeletionTable(lambda c: (c.isascii() and c.isalnum()) or c.isspace())
 
 class TextPreprocessor:
     """Handles removing punctuation and special characters."""
     
     def __init__(self):
-        self.punctuation_pattern = re.compile(r'[^\w\s]')
-        self.special_chars_pattern = re.compile(r'[^a-zA-Z0-9\s]')
-        self.multiple_spaces_pattern = re.compile(r'\s+')
+        self.punctuation_table = _PUNCTUATION_TABLE
+        self.special_chars_table = _SPECIAL_CHARS_TABLE
         
     def remove_punctuation(self, text: str) -> str:
         """Remove punctuation from text."""
-        return self.punctuation_pattern.sub('', text)
+        return text.translate(self.punctuation_table)
     
     def remove_special_characters(self, text: str) -> str:
         """Remove special characters from text."""
-        return self.special_chars_pattern.sub('', text)
+        return text.translate(self.special_chars_table)
     
     def normalize_spaces(self, text: str) -> str:
         """Normalize multiple spaces to single space."""
-        return self.multiple_spaces_pattern.sub(' ', text).strip()
+        return ' '.join(text.split())
     
     def preprocess(self, text: str) -> str:
-        text = self.remove_punctuation(text)
-        text = self.remove_special_characters(text)
-        text = self.normalize_spaces(text)
-        return text.lower()
\ No newline at end of file
+        # Whatever remove_punctuation drops, remove_special_characters drops too,
+        # so a single deletion pass followed by splitting on whitespace does the
+        # same as running all three steps
+        return ' '.join(self.remove_special_characters(text).split()).lower()
+
+# Shared instance; TextPreprocessor holds no per-instance state
+DEFAULT = TextPreprocessor()
\ No newline at end of file
@@ -1,14 +1,32 @@
 import re
 from typing import List
 
+# A token runs from the first to the last word character of a run of token
+# characters, so "@ko" gives "ko" and "p0h!!!" gives "p0h". These patterns
+# cannot backtrack badly, so the stdlib engine is kept; RE2 was slower here and
+# its \w and \b are ASCII-only, which would split words like "niño"
+_WORD_PATTERN = re.compile(r"\w(?:[\w@#$+!']*\w)?")
+# Same matches on ASCII text without the Unicode property lookups; with
+# re.ASCII the word boundary form is the faster spelling
+_ASCII_WORD_PATTERN = re.compile(r'\b[\w@#$+!\']+\b', re.ASCII)
+
 class Tokenizer:
     def __init__(self):
-        self.word_pattern = re.compile(r'\b[\w@#$+!\']+\b')
+        self.word_pattern = _WORD_PATTERN
+        self.ascii_word_pattern = _ASCII_WORD_PATTERN
         
     def tokenize(self, text: str) -> List[str]:
         """Tokenize text into words."""
-        return self.word_pattern.findall(text.lower())
+        # Lowercasing the whole text in C beats lowercasing each match in Python,
+        # and keeps "İ" (lowercased to "i" plus a combining dot) splitting as before
+        text = text.lower()
+        if text.isascii():
+            return self.ascii_word_pattern.findall(text)
+        return self.word_pattern.findall(text)
     
     def detokenize(self, tokens: List[str]) -> str:
         """Join tokens back into text."""
-        return ' '.join(tokens)
\ No newline at end of file
+        return ' '.join(tokens)
+
+# Shared instance; Tokenizer holds no per-instance state
+DEFAULT = Tokenizer()
\ No newline at end of file
@@ -1,18 +1,40 @@
 import sys
 import os
+import logging
 import warnings
-import time
-import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QLineEdit, QPushButton, 
                              QTextEdit, QFrame, QGridLayout)
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect, QRectF, pyqtSignal, QObject
-from PyQt5.QtGui import QFont, QPixmap, QPainter, QColor, QPen, QFontDatabase, QFontMetrics, QPainterPath
+from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QPointF, QRect, QRectF, pyqtSignal, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import (QFont, QPixmap, QPixmapCache, QPainter, QColor, QPen, QFontDatabase, QFontMetrics, QPainterPath,
+                         QStaticText, QTextOption, QTransform)
 from J3jemonly.jejemon_normalizer import JejemonNormalizer
 
+class NormalizeSignals(QObject):
+    result_ready = pyqtSignal(str, object)
+    failed = pyqtSignal(str)
+
+class NormalizeTask(QRunnable):
+    """Normalizes one text on a pool thread and reports back through signals"""
+    def __init__(self, normalizer, text, signals):
+        super().__init__()
+        self.normalizer = normalizer
+        self.text = text
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = self.normalizer.normalize_text(self.text)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.result_ready.emit(self.text, result)
+
 class ProcessStep(QFrame):
     step_completed = pyqtSignal(int, str)
     process_finished = pyqtSignal()
@@ -30,13 +52,33 @@ class ProcessStep(QFrame):
             }
         """)
         self.pixmap = None
+        self._scaled_pixmaps = {}  # border width -> (image rect, scaled pixmap)
         self.highlighted = False
         self.text = ""
+        self.text_font = None
+        # Caption layout, redone only when the text changes
+        self.static_text = QStaticText()
+        self.static_text.setTextFormat(Qt.PlainText)
+        self.static_text.setTextWidth(self.width() - 10)
+        text_option = QTextOption(Qt.AlignHCenter)
+        text_option.setWrapMode(QTextOption.WordWrap)
+        self.static_text.setTextOption(text_option)
         self.normalizer = None
-        self.processing_thread = None
+        # Delay between showing consecutive steps, and after the last one
+        self.step_delay_ms = 800
+        self.finish_delay_ms = 500
+        # Created on the GUI thread, so results from pool threads arrive here queued
+        self.task_signals = NormalizeSignals()
+        self.task_signals.result_ready.connect(self.show_steps)
+        self.task_signals.failed.connect(self.on_task_failed)
         
         if self.image_path and os.path.exists(self.image_path):
-            self.pixmap = QPixmap(self.image_path)
+            # Steps created for the same image share one decoded pixmap
+            pixmap = QPixmapCache.find(self.image_path)
+            if pixmap is None:
+                pixmap = QPixmap(self.image_path)
+                QPixmapCache.insert(self.image_path, pixmap)
+            self.pixmap = pixmap
 
     def set_normalizer(self, normalizer):
         """Set the normalizer for text processing"""
@@ -47,53 +89,51 @@ class ProcessStep(QFrame):
         if not self.normalizer:
             return
             
-        def worker():
-            try:
-                # Step 1: Original text
-                self.step_completed.emit(0, text)
-                time.sleep(0.8)
-                
-                # Step 2: Punctuation evaluation
-                result = self.normalizer.normalize_text(text) #type: ignore
-                self.step_completed.emit(1, result['punctuation_evaluated'])
-                time.sleep(0.8)
-                
-                # Step 3: Character replacement
-                self.step_completed.emit(2, result['character_replaced'])
-                time.sleep(0.8)
-                
-                # Step 4: Tokenization
-                self.step_completed.emit(3, result['tokenized'])
-                time.sleep(0.8)
-                
-                # Step 5: Normalization
-                self.step_completed.emit(4, result['normalized'])
-                time.sleep(0.5)
-                
-                self.process_finished.emit()
-                
-            except Exception as e:
-                print(f"Error in processing: {e}")
-                self.process_finished.emit()
-        
-        # Run in separate thread to prevent UI freezing
-        self.processing_thread = threading.Thread(target=worker)
-        self.processing_thread.daemon = True
-        self.processing_thread.start()
+        # Step 1: Original text
+        self.step_completed.emit(0, text)
+        # Normalize off the GUI thread; show_steps takes over with the result
+        QThreadPool.globalInstance().start(NormalizeTask(self.normalizer, text, self.task_signals))
+
+    def show_steps(self, text, result):
+        # Reveal the remaining steps one after another from the event loop;
+        # nothing blocks while waiting
+        step_texts = [
+            text,                               # Step 1: Original text
+            result['punctuation_evaluated'],    # Step 2: Punctuation evaluation
+            result['character_replaced'],       # Step 3: Character replacement
+            result['tokenized'],                # Step 4: Tokenization
+            result['normalized'],               # Step 5: Normalization
+        ]
+        for i in range(1, len(step_texts)):
+            QTimer.singleShot(i * self.step_delay_ms, partial(self.step_completed.emit, i, step_texts[i]))
+        finish_ms = (len(step_texts) - 1) * self.step_delay_ms + self.finish_delay_ms
+        QTimer.singleShot(finish_ms, self.process_finished.emit)
+
+    def on_task_failed(self, message):
+        print(f"Error in processing: {message}")
+        self.process_finished.emit()
 
     def update_text(self, text):
         self.text = text
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        rect = self.rect()
-        border_radius = 20
-        border_width = 4 if self.highlighted else 2
-        max_rect = rect.adjusted(border_width//2, border_width//2, -border_width//2, -border_width//2)
-        
-        if self.pixmap:
+    def showEvent(self, event):
+        # Once shown the step sits in its final parent, so build the font once here
+        if self.text_font is None:
+            parent = self.parent()
+            if parent and hasattr(parent, 'bright_aura_font') and parent.bright_aura_font:
+                self.text_font = QFont(parent.bright_aura_font, 10)
+        super().showEvent(event)
+
+    def resizeEvent(self, event):
+        self._scaled_pixmaps.clear()
+        super().resizeEvent(event)
+
+    def scaled_pixmap(self, border_width):
+        """Image rect and scaled pixmap for the given border width, cached until resized"""
+        cached = self._scaled_pixmaps.get(border_width)
+        if cached is None:
+            max_rect = self.rect().adjusted(border_width//2, border_width//2, -border_width//2, -border_width//2)
             img_ratio = self.pixmap.width() / self.pixmap.height()
             box_ratio = max_rect.width() / max_rect.height()
             if img_ratio > box_ratio:
@@ -105,11 +145,22 @@ class ProcessStep(QFrame):
             x = max_rect.left() + (max_rect.width() - img_w) // 2
             y = max_rect.top() + (max_rect.height() - img_h) // 2
             img_rect = QRect(x, y, img_w, img_h)
+            scaled_pixmap = self.pixmap.scaled(img_w, img_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            cached = self._scaled_pixmaps[border_width] = (img_rect, scaled_pixmap)
+        return cached
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        border_radius = 20
+        border_width = 4 if self.highlighted else 2
+        
+        if self.pixmap:
+            img_rect, scaled_pixmap = self.scaled_pixmap(border_width)
             path = QPainterPath()
             path.addRoundedRect(QRectF(img_rect), border_radius, border_radius)
             painter.save()
             painter.setClipPath(path)
-            scaled_pixmap = self.pixmap.scaled(img_w, img_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             painter.drawPixmap(img_rect, scaled_pixmap)
             painter.restore()
             border_color = QColor(76, 175, 80) if self.highlighted else QColor(68, 68, 68)
@@ -118,54 +169,92 @@ class ProcessStep(QFrame):
             painter.drawRoundedRect(QRectF(img_rect), border_radius, border_radius)
 
         painter.setPen(QColor(255, 255, 255))
-        parent = self.parent()
-        if parent and hasattr(parent, 'bright_aura_font') and parent.bright_aura_font:
-            font = QFont(parent.bright_aura_font, 10)
-            painter.setFont(font)
+        if self.text_font:
+            painter.setFont(self.text_font)
             
-        text_rect = QRectF(5, 85, self.width() - 10, 30)
-        painter.drawText(text_rect, Qt.AlignCenter | Qt.TextWordWrap, self.text)
+        if self.static_text.text() != self.text:
+            self.static_text.setText(self.text)
+            self.static_text.prepare(QTransform(), painter.font())
+        # Centered vertically in the 30px caption area below the image
+        text_height = self.static_text.size().height()
+        painter.drawStaticText(QPointF(5, 85 + (30 - text_height) / 2), self.static_text)
 
 class ArrowLabel(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(30, 20)
+        self.arrow_pixmap = None
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setPen(QPen(QColor(255, 255, 255), 2))
-        painter.drawLine(5, 10, 25, 10)
-        painter.drawLine(20, 5, 25, 10)
-        painter.drawLine(20, 15, 25, 10)
+        # Draw the arrow once (per screen pixel ratio) and blit it afterwards
+        ratio = self.devicePixelRatioF()
+        if self.arrow_pixmap is None or self.arrow_pixmap.devicePixelRatioF() != ratio:
+            self.arrow_pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+            self.arrow_pixmap.setDevicePixelRatio(ratio)
+            self.arrow_pixmap.fill(Qt.transparent)
+            painter = QPainter(self.arrow_pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(QColor(255, 255, 255), 2))
+            painter.drawLine(5, 10, 25, 10)
+            painter.drawLine(20, 5, 25, 10)
+            painter.drawLine(20, 15, 25, 10)
+            painter.end()
+        QPainter(self).drawPixmap(0, 0, self.arrow_pixmap)
 
 
 
 class JejemonGUI(QMainWindow):
+    normalizer_ready = pyqtSignal()
+
     def __init__(self):
         super().__init__()
-        self.normalizer = JejemonNormalizer()
+        # In KB; the five step images take about 21 MB once decoded
+        QPixmapCache.setCacheLimit(32 * 1024)
+        # Load the lexicon in the background while the window is built
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.normalizer_future = executor.submit(JejemonNormalizer)
+        executor.shutdown(wait=False)
         self.steps = []
         self.processing = False
         self.main_processor = None
         self.loadFonts()
         self.initUI()
+        # The done callback runs on the worker thread; the queued signal brings it back to the GUI thread
+        self.normalizer_ready.connect(self.on_normalizer_ready)
+        self.normalizer_future.add_done_callback(lambda future: self.normalizer_ready.emit())
+
+    @property
+    def normalizer(self):
+        """The normalizer, waiting for it to finish loading if necessary"""
+        return self.normalizer_future.result()
+
+    def on_normalizer_ready(self):
+        try:
+            normalizer = self.normalizer
+        except Exception as e:
+            print(f"Error loading normalizer: {e}")
+            self.input_field.setEnabled(False)
+            return
+        for step in self.steps:
+            step.set_normalizer(normalizer)
+        self.process_btn.setEnabled(True)
 
     def loadFonts(self):
         font_dir = "assets/fonts"
         self.bright_aura_font = None
         self.super_adorable_font = None
         if os.path.exists(font_dir):
-            for font_file in os.listdir(font_dir):
-                if font_file.endswith(('.ttf', '.otf')):
-                    font_path = os.path.join(font_dir, font_file)
-                    font_id = QFontDatabase.addApplicationFont(font_path)
-                    if font_id != -1:
-                        font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-                        if "bright" in font_file.lower() and "aura" in font_file.lower():
-                            self.bright_aura_font = font_family
-                        elif "super" in font_file.lower() and "adorable" in font_file.lower():
-                            self.super_adorable_font = font_family
+            with os.scandir(font_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.ttf', '.otf')) and entry.is_file():
+                        font_id = QFontDatabase.addApplicationFont(entry.path)
+                        if font_id != -1:
+                            font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
+                            name = entry.name.lower()
+                            if "bright" in name and "aura" in name:
+                                self.bright_aura_font = font_family
+                            elif "super" in name and "adorable" in name:
+                                self.super_adorable_font = font_family
 
     def initUI(self):
         self.setWindowTitle("JEJEMONLY")
@@ -246,7 +335,6 @@ class JejemonGUI(QMainWindow):
             vbox = QVBoxLayout()
             vbox.setSpacing(5)
             step = ProcessStep(title, icon_type, image_path=image_path)
-            step.set_normalizer(self.normalizer)  # Set the normalizer
             vbox.addWidget(step, alignment=Qt.AlignHCenter)
             self.steps.append(step)
 
@@ -267,6 +355,11 @@ class JejemonGUI(QMainWindow):
         layout.addLayout(steps_layout)
         layout.addSpacing(10)
 
+        # Use the first step as the main processor (they all have the same normalizer)
+        self.main_processor = self.steps[0]
+        self.main_processor.step_completed.connect(self.on_step_completed)
+        self.main_processor.process_finished.connect(self.on_process_finished)
+
         io_layout = QHBoxLayout()
         io_layout.setSpacing(15)
         input_layout = QHBoxLayout()
@@ -289,6 +382,7 @@ class JejemonGUI(QMainWindow):
             }
         """)
         self.process_btn.clicked.connect(self.process_text)
+        self.process_btn.setEnabled(False)  # Until the normalizer is loaded
         input_layout.addWidget(self.process_btn)
         io_layout.addLayout(input_layout)
         layout.addLayout(io_layout)
@@ -312,26 +406,22 @@ class JejemonGUI(QMainWindow):
 
     def process_text(self):
         text = self.input_field.text().strip()
-        if not text or self.processing:
+        # The steps only get a normalizer once it has loaded successfully
+        if not text or self.processing or self.main_processor.normalizer is None:
             return
         
         self.processing = True
         self.process_btn.setEnabled(False)
         self.input_field.setEnabled(False)
         
-        # Clear previous results
+        # Clear previous results; one update per step covers both changes
         for step in self.steps:
-            step.update_text("")
+            step.text = ""
             step.highlighted = False
             step.update()
         for label in self.step_labels:
             label.setText("")
         
-        # Use the first step as the main processor (they all have the same normalizer)
-        self.main_processor = self.steps[0]
-        self.main_processor.step_completed.connect(self.on_step_completed)
-        self.main_processor.process_finished.connect(self.on_process_finished)
-        
         # Start processing
         self.main_processor.process_text_step(text, self.step_labels)
 
@@ -339,13 +429,7 @@ class JejemonGUI(QMainWindow):
         self.step_labels[step_index].setText(text) # Update the step display
         self.highlight_step(self.steps[step_index]) # Highlight the current step
 
-    # Disconnect signals to prevent memory leaks
     def on_process_finished(self):
-        if self.main_processor:
-            self.main_processor.step_completed.disconnect()
-            self.main_processor.process_finished.disconnect()
-            self.main_processor = None
-            
         self.processing = False
         self.process_btn.setEnabled(True)
         self.input_field.setEnabled(True)
@@ -360,6 +444,7 @@ class JejemonGUI(QMainWindow):
         step.update()
 
 def main():
+    logging.getLogger("J3jemonly").setLevel(logging.WARNING)
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     window = JejemonGUI()
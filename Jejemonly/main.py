@@ -1,8 +1,18 @@
+import logging
+import sys
 from J3jemonly.jejemon_normalizer import JejemonNormalizer
 
 def main():
+    logging.getLogger("J3jemonly").setLevel(logging.WARNING)
     normalizer = JejemonNormalizer()
     
+    # Bulk mode: normalize piped input line by line, e.g. python main.py < posts.txt
+    if not sys.stdin.isatty():
+        lines = (line.strip() for line in sys.stdin)
+        for result in normalizer.normalize_batch(lines):
+            print(result['normalized'], flush=True)
+        return
+    
     print("Jejemon Text Normalizer")
     print("-" * 40)
     